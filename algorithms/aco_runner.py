@@ -0,0 +1,721 @@
+import time
+import random
+import multiprocessing as mp
+
+import numpy as np
+import matplotlib.pyplot as plt
+import matplotlib.animation as animation
+from matplotlib.animation import FFMpegWriter
+from tqdm import tqdm
+
+from algorithms.ga_core import (
+    prepare_environment,
+    create_graph,
+    evaluate_clean_distance,
+    MIN_SEP,
+    MOVE_ORTH,
+    MOVE_DIAG,
+    COLLISION_PENALTY,
+)
+
+
+# Coste de paso indexado por |dy| + |dx| (solo hay dos casos
+# posibles en un grid 8-conectado)
+_STEP_COST = {1: MOVE_ORTH, 2: MOVE_DIAG}
+
+
+# ==========================================================
+# ACO MULTI-AGENTE
+#   - Cada hormiga construye una solución COMPLETA
+#     (una ruta por agente, compartiendo ocupación temporal)
+#   - Feromonas sobre las aristas del grafo 8-conectado
+# ==========================================================
+class ACO_MultiAgent:
+    def __init__(self, env, starts, picks, drops,
+                 num_ants=25, iterations=200,
+                 alpha=1.0, beta=2.0, rho=0.10,
+                 q=100.0, w_conf=COLLISION_PENALTY,
+                 max_steps=4000, seed=0):
+        self.env = env
+        self.starts = starts
+        self.picks = picks
+        self.drops = drops
+
+        self.num_ants = num_ants
+        self.iterations = iterations
+        self.alpha = alpha
+        self.beta = beta
+        self.rho = rho
+        self.q = q
+        self.w_conf = w_conf
+        self.max_steps = max_steps
+        self.best_bound = float("inf")
+
+        # PCG64 en C: permite pre-generar los uniformes de la ruleta
+        # en bloque en vez de un random.random() por paso
+        self.rng = np.random.default_rng(seed)
+
+        self.G = create_graph(env)
+
+        # ------------------------------------------------------
+        # Adyacencia densa precomputada (una fila por nodo,
+        # 8 slots de vecino rellenados con -1). Se construye UNA
+        # vez desde el grafo para no materializar list(self.G[u])
+        # en cada paso de cada hormiga.
+        # ------------------------------------------------------
+        self.H, self.W = env.shape
+        n_nodes = self.H * self.W
+
+        # Nodos como IDs enteros y*W + x: toda la construcción de
+        # rutas trabaja en espacio de IDs (indexado directo de array
+        # en vez de hash de tuplas); solo se vuelve a (y, x) al
+        # emitir las rutas finales
+        self.start_ids = [y * self.W + x for (y, x) in starts]
+        self.pick_ids = [y * self.W + x for (y, x) in picks]
+        self.drop_ids = [y * self.W + x for (y, x) in drops]
+
+        self.neighbors = np.full((n_nodes, 8), -1, dtype=np.int32)
+        self.dist_cost = np.zeros((n_nodes, 8), dtype=np.float32)
+
+        # Feromona por arista, alineada con los slots de vecino:
+        # pher[uid, s] es la arista u → neighbors[uid, s]. La matriz
+        # preasignada evita el hash de tuplas (u, v) por acceso.
+        # float32: la heurística no necesita precisión doble y la
+        # evaporación/ruleta mueven la mitad de memoria por iteración
+        self.pher = np.full((n_nodes, 8), 0.01, dtype=np.float32)
+        self.evap_scale = 1.0
+
+        self.n_neigh = np.zeros(n_nodes, dtype=np.int8)
+
+        for u in self.G:
+            uid = u[0] * self.W + u[1]
+            vecinos = list(self.G[u])
+            self.n_neigh[uid] = len(vecinos)
+            for s, v in enumerate(vecinos):
+                self.neighbors[uid, s] = v[0] * self.W + v[1]
+                self.dist_cost[uid, s] = self.G[u][v]["weight"]
+
+        # η^β depende solo de la arista y de beta (fijos): se tabula
+        # una vez y la ruleta se ahorra una división y una potencia
+        # por vecino en cada paso
+        self.eta_beta = ((1.0 / (self.dist_cost + 1e-9)) ** self.beta
+                         ).astype(np.float32)
+
+    # ------------------------------------------------------
+    # Coste de un paso (ortogonal o diagonal). Fuera de los
+    # caminos calientes: ahí se usan dist_cost / np.diff
+    # ------------------------------------------------------
+    def dist(self, a, b):
+        return _STEP_COST[abs(a[0] - b[0]) + abs(a[1] - b[1])]
+
+    # ------------------------------------------------------
+    # Elección del siguiente nodo (ruleta sobre feromona·η).
+    # Trabaja íntegramente con IDs de nodo.
+    # ------------------------------------------------------
+    def choose_next(self, uid, timestep, occ, r):
+        k = self.n_neigh[uid]
+        if k == 0:
+            return None
+
+        nbr = self.neighbors[uid, :k]
+        if k == 1:
+            # Sin alternativa: no hay nada que sortear
+            return int(nbr[0])
+
+        # Ruleta vectorizada: potencias, cumsum y searchsorted en C
+        tau = self.pher[uid, :k]
+        vals = tau ** self.alpha * self.eta_beta[uid, :k]
+
+        # Penalizar (no prohibir) celdas ya ocupadas en ese instante
+        if timestep < occ.shape[0]:
+            vals = np.where(occ[timestep, nbr], vals * 1e-4, vals)
+
+        cdf = np.cumsum(vals)
+        idx = np.searchsorted(cdf, r * cdf[-1])
+        return int(nbr[min(idx, k - 1)])
+
+    # ------------------------------------------------------
+    # Ruta de UN agente: start → pick → drop → start
+    #   - El timestep es el índice dentro del array; se marca
+    #     la ocupación temporal al avanzar
+    # ------------------------------------------------------
+    def build_route_single(self, start_id, pick_id, drop_id, occ):
+        nodo = start_id
+        t = 0
+        ruta = np.empty(self.max_steps + 1, dtype=np.int32)
+        ruta[0] = start_id
+        occ[0, start_id] = True
+
+        # Uniformes de la ruleta pre-generados en bloque
+        rands = self.rng.random(self.max_steps + 1)
+
+        for goal in (pick_id, drop_id, start_id):
+            while nodo != goal:
+                if t >= self.max_steps:
+                    return None
+                nxt = self.choose_next(nodo, t + 1, occ, rands[t])
+                if nxt is None:
+                    return None
+                t += 1
+                ruta[t] = nxt
+                if t < occ.shape[0]:
+                    occ[t, nxt] = True
+                nodo = nxt
+
+        # De vuelta a coordenadas (y, x) solo al cerrar la ruta
+        ids = ruta[:t + 1]
+        out = np.empty((t + 1, 2), dtype=np.int32)
+        out[:, 0] = ids // self.W
+        out[:, 1] = ids % self.W
+        return out
+
+    # ------------------------------------------------------
+    # Distancia de una ruta y conflictos contra rutas previas
+    # (cotas parciales para la poda de build_solution_multi)
+    # ------------------------------------------------------
+    def _route_distance(self, ruta):
+        difs = np.abs(np.diff(ruta, axis=0)).sum(axis=1)
+        return float(np.where(difs == 2, MOVE_DIAG, MOVE_ORTH).sum())
+
+    def _conflicts_vs(self, ruta, rutas_prev):
+        maxT = max(len(ruta), max(len(r) for r in rutas_prev))
+
+        def pad(r):
+            out = np.empty((maxT, 2), dtype=np.int32)
+            out[:len(r)] = r
+            out[len(r):] = r[-1]
+            return out
+
+        nueva = pad(ruta)
+        n = 0
+        for r in rutas_prev:
+            d2 = ((nueva - pad(r)) ** 2).sum(axis=1)
+            n += int((d2 < MIN_SEP * MIN_SEP).sum())
+        return n
+
+    # ------------------------------------------------------
+    # Solución completa de una hormiga (todas las rutas)
+    #   - bound: mejor score conocido; si el coste parcial
+    #     acumulado (distancia + conflictos contra las rutas ya
+    #     construidas) lo supera, la hormiga ya no puede ganar y
+    #     se aborta su construcción (branch-and-bound)
+    # ------------------------------------------------------
+    def build_solution_multi(self, bound=float("inf")):
+        # Ocupación temporal como array booleano denso: el acceso
+        # occ[t, nid] evita el hash de tuplas (t, nodo) por paso.
+        t_horizon = 4 * (self.H + self.W)
+        occ = np.zeros((t_horizon, self.H * self.W), dtype=bool)
+        rutas = []
+        running = 0.0
+        for k in range(len(self.starts)):
+            ruta = self.build_route_single(
+                self.start_ids[k], self.pick_ids[k], self.drop_ids[k], occ
+            )
+            if ruta is None:
+                return None
+
+            running += self._route_distance(ruta)
+            if rutas:
+                running += self.w_conf * self._conflicts_vs(ruta, rutas)
+            if running > bound:
+                return None
+
+            rutas.append(ruta)
+        return rutas
+
+    # ------------------------------------------------------
+    # Construcción de TODAS las hormigas en lockstep
+    #   - En vez de num_ants bucles Python independientes, todas
+    #     las hormigas avanzan un timestep a la vez: el gather de
+    #     feromona/η, las potencias y la ruleta (cumsum + argmax)
+    #     se hacen en bloque sobre el eje "hormiga". Solo el
+    #     chequeo de ocupación propia queda en Python (cada
+    #     hormiga tiene su propia ocupación temporal, que aquí se
+    #     guarda como set de claves t*n_nodes + nodo para no pagar
+    #     un array (num_ants, T, H, W)).
+    # ------------------------------------------------------
+    def build_solutions_batch(self, n_ants):
+        n_nodes = self.H * self.W
+        t_horizon = 4 * (self.H + self.W)
+
+        rutas_all = [[] for _ in range(n_ants)]
+        failed = np.zeros(n_ants, dtype=bool)
+        occs = [set() for _ in range(n_ants)]
+
+        for k in range(len(self.starts)):
+            start_id = self.start_ids[k]
+            goal_ids = (self.pick_ids[k], self.drop_ids[k],
+                        self.start_ids[k])
+
+            # Matriz de uniformes pre-generada para todo el tramo
+            rands = self.rng.random((n_ants, self.max_steps + 1))
+
+            curr = np.full(n_ants, start_id, dtype=np.int32)
+            phase = np.zeros(n_ants, dtype=np.int8)
+            done = failed.copy()
+            rutas_k = [[start_id] for _ in range(n_ants)]
+            for a in range(n_ants):
+                if not failed[a]:
+                    occs[a].add(start_id)  # t = 0
+
+            t = 0
+            while not done.all():
+                if t >= self.max_steps:
+                    failed |= ~done
+                    break
+                t += 1
+
+                act = np.flatnonzero(~done)
+                uids = curr[act]
+
+                # Gather + pesos de la ruleta para todas las hormigas
+                # activas de una vez
+                neigh = self.neighbors[uids]
+                vals = (self.pher[uids] ** self.alpha
+                        * self.eta_beta[uids])
+                vals[neigh < 0] = 0.0
+
+                # Penalización por ocupación propia (por hormiga)
+                if t < t_horizon:
+                    base = t * n_nodes
+                    for j, a in enumerate(act):
+                        occ = occs[a]
+                        for s in range(8):
+                            nid = neigh[j, s]
+                            if nid >= 0 and base + nid in occ:
+                                vals[j, s] *= 1e-4
+
+                cdf = np.cumsum(vals, axis=1)
+                tot = cdf[:, -1]
+                r = rands[act, t] * tot
+                idx = (cdf >= r[:, None]).argmax(axis=1)
+                nxt = neigh[np.arange(len(act)), idx]
+
+                base = t * n_nodes
+                for j, a in enumerate(act):
+                    if tot[j] <= 0.0:
+                        # Nodo aislado: la hormiga no puede continuar
+                        failed[a] = True
+                        done[a] = True
+                        continue
+                    nid = int(nxt[j])
+                    rutas_k[a].append(nid)
+                    if t < t_horizon:
+                        occs[a].add(base + nid)
+                    curr[a] = nid
+                    while phase[a] < 3 and nid == goal_ids[phase[a]]:
+                        phase[a] += 1
+                    if phase[a] == 3:
+                        done[a] = True
+
+            for a in range(n_ants):
+                if not failed[a]:
+                    ids = np.asarray(rutas_k[a], dtype=np.int32)
+                    ruta = np.empty((len(ids), 2), dtype=np.int32)
+                    ruta[:, 0] = ids // self.W
+                    ruta[:, 1] = ids % self.W
+                    rutas_all[a].append(ruta)
+
+        return [None if failed[a] else rutas_all[a]
+                for a in range(n_ants)]
+
+    # ------------------------------------------------------
+    # Conflictos temporales (mismo criterio que detect_conflicts:
+    # pares de agentes a distancia < MIN_SEP en cada timestep),
+    # pero vectorizado sobre un array (A, T, 2) con padding
+    # ------------------------------------------------------
+    def _padded_positions(self, rutas_nodos):
+        A = len(rutas_nodos)
+        maxT = max(len(r) for r in rutas_nodos)
+
+        pos = np.empty((A, maxT, 2), dtype=np.int32)
+        for i, r in enumerate(rutas_nodos):
+            arr = np.asarray(r, dtype=np.int32)
+            pos[i, :len(r)] = arr
+            pos[i, len(r):] = arr[-1]
+        return pos
+
+    def count_conflicts(self, rutas_nodos):
+        pos = self._padded_positions(rutas_nodos)
+        A = pos.shape[0]
+
+        diff = pos[:, None, :, :] - pos[None, :, :, :]
+        d2 = (diff * diff).sum(axis=-1)
+
+        iu, ju = np.triu_indices(A, 1)
+        return int((d2[iu, ju] < MIN_SEP * MIN_SEP).sum())
+
+    # ------------------------------------------------------
+    # Puntuación: distancia total + penalización por conflictos
+    #   - bound: mejor score conocido; los conflictos se cuentan
+    #     por bloques de timesteps y en cuanto el score parcial
+    #     supera la cota se corta (la mayoría de hormigas malas
+    #     quedan descartadas sin recorrer toda la línea temporal)
+    # ------------------------------------------------------
+    def score_solution(self, rutas, bound=float("inf")):
+        # Hormiga fallida o podada por la cota: score infinito para que
+        # nunca desbanque a una solución completa (los scores reales de
+        # las primeras iteraciones superan de largo cualquier constante
+        # finita de penalización)
+        if rutas is None:
+            return float("inf")
+
+        total_dist = 0.0
+        for ruta in rutas:
+            difs = np.abs(np.diff(ruta, axis=0)).sum(axis=1)
+            total_dist += np.where(difs == 2, MOVE_DIAG, MOVE_ORTH).sum()
+
+        if total_dist > bound:
+            return total_dist
+
+        pos = self._padded_positions(rutas)
+        A, maxT = pos.shape[0], pos.shape[1]
+        iu, ju = np.triu_indices(A, 1)
+        min_sep2 = MIN_SEP * MIN_SEP
+
+        score = total_dist
+        chunk = 256
+        for t0 in range(0, maxT, chunk):
+            blk = pos[:, t0:t0 + chunk]
+            diff = blk[:, None, :, :] - blk[None, :, :, :]
+            d2 = (diff * diff).sum(axis=-1)
+            score += self.w_conf * int((d2[iu, ju] < min_sep2).sum())
+            if score > bound:
+                return score
+
+        return score
+
+    # ------------------------------------------------------
+    # Evaporación global de feromona (perezosa)
+    #   - La ruleta es invariante a escalar TODAS las feromonas
+    #     por una constante, así que basta acumular el factor en
+    #     un escalar y compensarlo en los depósitos. El multiply
+    #     sobre la matriz solo se paga al reescalar por underflow.
+    # ------------------------------------------------------
+    def evaporate(self):
+        self.evap_scale *= (1.0 - self.rho)
+        if self.evap_scale < 1e-6:
+            np.multiply(self.pher, self.evap_scale, out=self.pher)
+            self.evap_scale = 1.0
+
+    # ------------------------------------------------------
+    # Refuerzo elitista sobre la mejor solución
+    # ------------------------------------------------------
+    def reinforce(self, rutas, score):
+        # Valor real = pher * evap_scale → depositar dep/evap_scale
+        dep = self.q / (score + 1e-9) / self.evap_scale
+        for ruta in rutas:
+            nodos = ruta[:, 0] * self.W + ruta[:, 1]
+            orig = nodos[:-1]
+            # Slot de cada arista recorrida, resuelto en bloque contra
+            # la fila de vecinos de su nodo origen
+            slots = (self.neighbors[orig] == nodos[1:, None]).argmax(axis=1)
+            np.add.at(self.pher, (orig, slots), dep)
+
+    # ------------------------------------------------------
+    # Una iteración de la colonia: construir y puntuar todas
+    # las hormigas. La feromona solo se LEE aquí (evaporación y
+    # refuerzo quedan fuera), así que el kernel es paralelizable
+    # sin sincronización.
+    # ------------------------------------------------------
+    def run_iteration(self, it, bound, n_jobs=1):
+        if n_jobs is not None and n_jobs > 1:
+            # El fork del pool hereda el estado actual como snapshot.
+            # Semillas deterministas por (iteración, hormiga) para
+            # reproducibilidad.
+            global _POOL_ACO
+            self.best_bound = bound
+            _POOL_ACO = self
+            seeds = [it * self.num_ants + a
+                     for a in range(self.num_ants)]
+            with mp.Pool(processes=n_jobs) as pool:
+                return pool.map(_ant_worker, seeds)
+
+        # Construcción en lockstep: todas las hormigas avanzan
+        # a la vez y los choose_next se baten en bloque
+        soluciones = self.build_solutions_batch(self.num_ants)
+        return [(self.score_solution(rutas, bound=bound), rutas)
+                for rutas in soluciones]
+
+    # ------------------------------------------------------
+    # Bucle principal
+    # ------------------------------------------------------
+    def run(self, debug_interval=20, n_jobs=1):
+        best_score = float("inf")
+        best_rutas = None
+        best_hist = []
+
+        for it in range(1, self.iterations + 1):
+            resultados = self.run_iteration(it, best_score, n_jobs=n_jobs)
+
+            for score, rutas in resultados:
+                if rutas is None:
+                    continue
+                if score < best_score:
+                    best_score = score
+                    best_rutas = rutas
+
+            self.evaporate()
+            if best_rutas is not None:
+                self.reinforce(best_rutas, best_score)
+
+            best_hist.append(best_score)
+
+            if debug_interval is not None and debug_interval > 0:
+                if it % debug_interval == 0 or it == 1:
+                    print(
+                        f"[IT {it:4d}] "
+                        f"BestScore={best_score:.2f}"
+                    )
+
+        return best_rutas, best_score, best_hist
+
+
+# ==========================================================
+# WORKER PARA CONSTRUCCIÓN PARALELA DE HORMIGAS
+#   - La instancia se hereda vía fork; la evaporación y el
+#     refuerzo siguen siendo seriales en el proceso principal
+# ==========================================================
+_POOL_ACO = None
+
+
+def _ant_worker(seed):
+    # Generador propio y determinista por (iteración, hormiga)
+    _POOL_ACO.rng = np.random.default_rng(seed)
+    rutas = _POOL_ACO.build_solution_multi(bound=_POOL_ACO.best_bound)
+    return _POOL_ACO.score_solution(rutas, bound=_POOL_ACO.best_bound), rutas
+
+
+# ==========================================================
+# VISUALIZACIÓN DE RUTAS (ACO)
+# ==========================================================
+def plot_routes_aco(env, routes, starts, picks, drops):
+    H, W = env.shape
+    colors = ["tab:blue", "tab:orange", "tab:green", "tab:red",
+              "tab:purple", "tab:brown", "tab:pink"]
+
+    plt.figure(figsize=(8, 8))
+    plt.imshow(env, cmap="gray", origin="upper")
+    plt.title("Optimized Multi-Agent Routes (ACO)")
+
+    for k, r in enumerate(routes):
+        ys = [p[0] for p in r]
+        xs = [p[1] for p in r]
+        c = colors[k % len(colors)]
+        plt.plot(xs, ys, '-', color=c, lw=2, label=f"Agent {k+1}")
+
+        sy, sx = starts[k]
+        py, px = picks[k]
+        dy, dx = drops[k]
+
+        plt.plot(sx, sy, 'o', color=c, markersize=9, markerfacecolor='none')
+        plt.plot(px, py, 's', color=c, markersize=9, markerfacecolor='none')
+        plt.plot(dx, dy, 'X', color=c, markersize=9)
+
+    plt.legend(loc="upper right")
+    plt.grid(False)
+    plt.show()
+
+
+# ==========================================================
+# CURVA DE CONVERGENCIA (MEJOR SCORE POR ITERACIÓN)
+# ==========================================================
+def plot_convergence_aco(best_hist):
+    best_hist = np.array(best_hist, dtype=float)
+    iters = np.arange(1, len(best_hist) + 1)
+
+    plt.figure(figsize=(10, 5))
+    plt.yscale("log")
+
+    plt.plot(iters, best_hist, label="Best Score (so far)", linewidth=2)
+
+    plt.xlabel("Iteration")
+    plt.ylabel("Penalized Score")
+    plt.title("ACO Convergence")
+    plt.legend()
+    plt.grid(True, linestyle='--', alpha=0.4)
+    plt.tight_layout()
+    plt.show()
+
+
+# ==========================================================
+# ANIMACIÓN TEMPORAL
+# ==========================================================
+def animate_aco_routes(env, rutas, starts, picks, drops, show=True):
+    colors = ['lime', 'red', 'cyan', 'yellow', 'magenta', 'orange']
+    A = len(rutas)
+
+    fig, ax = plt.subplots(figsize=(8, 8))
+    ax.imshow(env, cmap="gray", origin="upper")
+    ax.set_title("Spatiotemporal Evolution of Multi-Agent Routes (ACO)")
+
+    for i, c in enumerate(colors[:A]):
+        sy, sx = starts[i]
+        py, px = picks[i]
+        dy, dx = drops[i]
+        ax.plot(sx, sy, 'o', color=c, markersize=8, markerfacecolor='none')
+        ax.plot(px, py, 's', color=c, markersize=8, markerfacecolor='none')
+        ax.plot(dx, dy, 'X', color=c, markersize=8)
+
+        # Trazado completo estático; la animación solo mueve las cabezas
+        ruta = np.asarray(rutas[i])
+        ax.plot(ruta[:, 1], ruta[:, 0], '-', color=c, lw=1, alpha=0.5)
+
+    # Posiciones densas precomputadas: positions[t, i] = (y, x) del
+    # agente i en el frame t (última posición repetida como padding)
+    n_frames = max(len(r) for r in rutas)
+    positions = np.empty((n_frames, A, 2), dtype=np.int16)
+    for i, r in enumerate(rutas):
+        arr = np.asarray(r, dtype=np.int16)
+        positions[:len(arr), i] = arr
+        positions[len(arr):, i] = arr[-1]
+
+    # Un único artista para todos los agentes: un set_offsets por
+    # frame en lugar de un set_data por agente
+    scat = ax.scatter(positions[0, :, 1], positions[0, :, 0],
+                      c=colors[:A], s=60, edgecolors='black', zorder=5)
+
+    txt_frame = ax.text(2, 5, "", color='white', fontsize=11)
+
+    def update(frame):
+        scat.set_offsets(positions[frame, :, ::-1])
+        txt_frame.set_text(f"Frame: {frame}")
+        return [scat, txt_frame]
+
+    ani = animation.FuncAnimation(
+        fig, update,
+        frames=n_frames,
+        interval=70,
+        blit=True,
+        repeat=True,
+        cache_frame_data=False
+    )
+
+    if show:
+        plt.show()
+
+    return ani
+
+
+# ==========================================================
+# WRITER MP4
+# ==========================================================
+class FFMpegWriterWithProgress(FFMpegWriter):
+    def __init__(self, total_frames, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pbar = tqdm(total=total_frames, desc="Renderizando vídeo (ACO)",
+                         unit="frame")
+
+    def grab_frame(self, **savefig_kwargs):
+        super().grab_frame(**savefig_kwargs)
+        self.pbar.update(1)
+
+    def finish(self):
+        super().finish()
+        self.pbar.close()
+
+
+# ==========================================================
+#       EJECUCIÓN DEL ACO COMPLETO
+# ==========================================================
+def run_aco(
+    num_ants=25,
+    iterations=200,
+    alpha=1.0,
+    beta=2.0,
+    rho=0.10,
+    seed=42,
+    show_plots=False,
+    show_anim=False,
+    save_anim=False,
+    anim_file="routes_animation_aco.mp4",
+    debug_interval=20,
+    n_jobs=1
+):
+    """
+    Optimización de las rutas multi-agente usando Ant Colony Optimization.
+
+    Devuelve un diccionario con:
+      - best_penalized: mejor score penalizado
+      - best_distance: mejor distancia real (métrica limpia)
+      - routes: rutas del mejor individuo (listas de nodos)
+      - best_hist: historial del mejor score por iteración
+      - time_sec: tiempo total de cómputo
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+
+    env, starts, picks, drops = prepare_environment()
+
+    aco = ACO_MultiAgent(
+        env, starts, picks, drops,
+        num_ants=num_ants,
+        iterations=iterations,
+        alpha=alpha,
+        beta=beta,
+        rho=rho,
+        seed=seed
+    )
+
+    start_t = time.time()
+    best_rutas, best_score, best_hist = aco.run(
+        debug_interval=debug_interval, n_jobs=n_jobs
+    )
+    end_t = time.time()
+
+    if best_rutas is None:
+        raise RuntimeError("ACO no encontró ninguna solución completa.")
+
+    # Rutas como listas de nodos (igual que el resto de runners)
+    routes = [[(int(p[0]), int(p[1])) for p in ruta] for ruta in best_rutas]
+    best_distance = evaluate_clean_distance(routes)
+
+    print("\n===== ACO COMPLETADO =====")
+    print(f"Mejor score penalizado = {best_score:.3f}")
+    print(f"Mejor distancia real   = {best_distance:.3f}")
+    print(f"Tiempo = {end_t - start_t:.2f} s")
+
+    if show_plots:
+        plot_routes_aco(env, routes, starts, picks, drops)
+        plot_convergence_aco(best_hist)
+
+    ani = None
+    if show_anim or save_anim:
+        # Si solo se guarda a disco, la figura se reutiliza para el
+        # writer sin pasar por la ventana interactiva
+        ani = animate_aco_routes(env, best_rutas, starts, picks, drops,
+                                 show=show_anim)
+
+    if save_anim and ani is not None:
+        print(f"Guardando vídeo ACO en: {anim_file}")
+        total_frames = max(len(r) for r in routes)
+        writer = FFMpegWriterWithProgress(
+            total_frames=total_frames,
+            fps=20,
+            bitrate=1800
+        )
+        ani.save(anim_file, writer=writer)
+        print("✔ Vídeo guardado.")
+
+    return {
+        "best_penalized": best_score,
+        "best_distance": best_distance,
+        "routes": routes,
+        "best_hist": best_hist,
+        "time_sec": end_t - start_t
+    }
+
+
+if __name__ == "__main__":
+    run_aco(
+        num_ants=25,
+        iterations=200,
+        alpha=1.0,
+        beta=2.0,
+        rho=0.10,
+        seed=42,
+        show_plots=False,
+        show_anim=False,
+        save_anim=False,
+        debug_interval=20
+    )
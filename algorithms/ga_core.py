@@ -125,19 +125,31 @@ def mutate_segment(route, G):
 
 def detect_conflicts(routes):
     K = len(routes)
+    if K < 2:
+        return [], float("inf")
+
     maxT = max(len(r) for r in routes)
-    conflicts = []
-    min_dist = float("inf")
-
-    for t in range(maxT):
-        pos = [r[min(t, len(r)-1)] for r in routes]
-        for i in range(K):
-            for j in range(i+1, K):
-                y1,x1 = pos[i]; y2,x2 = pos[j]
-                d = math.hypot(y1-y2, x1-x2)
-                min_dist = min(min_dist, d)
-                if d < MIN_SEP:
-                    conflicts.append(t)
+
+    # Rutas paddeadas (última posición repetida) en un array (K, T, 2):
+    # todas las distancias pareja×timestep salen de una sola expresión
+    # broadcasted en vez de C(K,2)·T llamadas escalares a hypot
+    pos = np.empty((K, maxT, 2), dtype=float)
+    for i, r in enumerate(routes):
+        arr = np.asarray(r, dtype=float)
+        pos[i, :len(r)] = arr
+        pos[i, len(r):] = arr[-1]
+
+    diff = pos[:, None, :, :] - pos[None, :, :, :]
+    d2 = (diff * diff).sum(axis=-1)
+
+    iu, ju = np.triu_indices(K, 1)
+    d2_pairs = d2[iu, ju]          # (n_parejas, T) al cuadrado
+
+    # Comparar al cuadrado evita la raíz sobre todo el array:
+    # solo hace falta un sqrt escalar para el mínimo final
+    min_dist = math.sqrt(float(d2_pairs.min()))
+    # Un t por pareja en conflicto, como en la versión escalar
+    conflicts = [int(t) for t in np.sort(np.nonzero(d2_pairs < MIN_SEP * MIN_SEP)[1])]
     return conflicts, min_dist
 
 def mutate_conflict(route, G, conflicts):
@@ -302,11 +314,27 @@ def evaluate_multi(ind, picks, drops, base_routes):
     Devuelve:
       - objetivo 1: fitness penalizado (como evaluate)
       - objetivo 2: distancia limpia total (evaluate_clean_distance)
+
+    Un solo recorrido por las rutas: la distancia limpia se acumula en
+    el mismo bucle que los términos penalizados, en vez de volver a
+    pasar cost_distance sobre todas las rutas una segunda vez.
     """
-    penal_tuple = evaluate(ind, picks, drops, base_routes)
-    penal = penal_tuple[0]
-    clean = evaluate_clean_distance(ind)
-    return (penal, clean)
+    if any(r is None for r in ind):
+        return (BIG_PENALTY, BIG_PENALTY)
+
+    clean = 0.0
+    total = 0.0
+    for k, r in enumerate(ind):
+        d = cost_distance(r)
+        clean += d
+        total += d
+        total += WAIT_PENAL * cost_waits(r)
+        total += cost_wait_blocks(r)
+        total += cost_backtracking(r)
+        total += penal_pick_drop(r, picks[k], drops[k])
+
+    total += penal_temporal(ind)
+    return (total, clean)
 
 # ==============================================================
 # GA SETUP
@@ -444,16 +472,18 @@ def show_env_grid_with_points(env, starts, picks, drops):
     colors = ["green", "blue", "orange", "purple", "cyan", "yellow"]
     markers = {"start": "o", "pick": "x", "drop": "s"}
 
-    for k, (s, p, d) in enumerate(zip(starts, picks, drops)):
-        color = colors[k % len(colors)]
-        sy, sx = s
-        py, px = p
-        dy, dx = d
-
-        ax.plot(sx, sy, markers["start"], color=color, markersize=10)
-        ax.plot(px, py, markers["pick"], color=color,
-                markersize=12, markeredgewidth=2)
-        ax.plot(dx, dy, markers["drop"], color=color, markersize=10)
+    # Un scatter por tipo de marcador (color por punto vía c=...) en vez
+    # de 3 artistas por agente: menos colecciones que crear y rasterizar
+    agent_colors = [colors[k % len(colors)] for k in range(len(starts))]
+    for pts, marker, size, lw in (
+        (starts, markers["start"], 100, 1),
+        (picks,  markers["pick"],  144, 2),
+        (drops,  markers["drop"],  100, 1),
+    ):
+        ys = [p[0] for p in pts]
+        xs = [p[1] for p in pts]
+        ax.scatter(xs, ys, c=agent_colors, marker=marker,
+                   s=size, linewidths=lw)
 
     ax.invert_yaxis()
     plt.tight_layout()
@@ -56,6 +56,8 @@ def init_session():
         session['points'] = {str(a): {} for a in range(N_AGENTS)}
     if 'routes' not in session:
         session['routes'] = None
+    if 'version' not in session:
+        session['version'] = 0
 
 def get_current_stage_name():
     """Get current stage name"""
@@ -65,6 +67,50 @@ def get_current_agent():
     """Get current agent index"""
     return session['agent']
 
+def cumulative_distances(paths):
+    """Distancia acumulada por agente, vectorizada con NumPy.
+
+    Un cumsum en C por ruta sustituye al bucle O(max_len²) que
+    re-sumaba todas las aristas para cada frame en el cliente.
+    """
+    cum = []
+    for route in paths:
+        arr = np.asarray(route, dtype=np.float32)
+        steps = np.hypot(np.diff(arr[:, 0]), np.diff(arr[:, 1]))
+        c = np.concatenate(([0.0], np.cumsum(steps)))
+        # float32 + redondeo: los valores serializan con pocos dígitos
+        # en vez de 17 decimales de float64, que dominaban el JSON
+        cum.append(np.round(c, 3).tolist())
+    return cum
+
+
+# Memo de optimizaciones: mismos puntos → misma solución (el GA es
+# determinista con seed=0), así que repetir "Optimizar rutas" sin tocar
+# nada se resuelve con un lookup en vez de otra ejecución completa
+_GA_CACHE = {}
+_GA_CACHE_MAX = 32
+
+
+def _cached_ga(starts, picks, drops):
+    key = (starts, picks, drops)
+    result = _GA_CACHE.get(key)
+    if result is None:
+        result = run_ga_multi_streamlit(
+            env,
+            starts=list(starts),
+            picks=list(picks),
+            drops=list(drops),
+            pop_size=120,
+            ngen=70,
+            cxpb=0.6,
+            mutpb=0.3,
+            seed=0
+        )
+        if len(_GA_CACHE) >= _GA_CACHE_MAX:
+            _GA_CACHE.pop(next(iter(_GA_CACHE)))
+        _GA_CACHE[key] = result
+    return result
+
 # =============================================================
 # API ROUTES
 # =============================================================
@@ -78,23 +124,35 @@ def index():
 @app.route('/api/map')
 def get_map():
     """Serve the hospital map image"""
-    return send_file(MAP_PATH, mimetype='image/bmp')
+    # El plano no cambia entre despliegues: cacheable de forma agresiva
+    resp = send_file(MAP_PATH, mimetype='image/bmp', max_age=31536000)
+    resp.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return resp
 
-@app.route('/api/map-hires')
-def get_map_hires():
-    """Serve high-resolution map for Plotly (4x scale)"""
-    # Load original image
+def _build_map_hires_png():
+    """Reescala el plano a 4x y lo codifica a PNG una sola vez."""
     img = Image.open(MAP_PATH).convert('RGB')
     # Scale up 4x with NEAREST for crisp pixels
-    new_size = (img.width * 4, img.height * 4)
-    img_scaled = img.resize(new_size, Image.NEAREST)
-    
-    # Save to bytes
+    img_scaled = img.resize((img.width * 4, img.height * 4), Image.NEAREST)
     img_io = io.BytesIO()
     img_scaled.save(img_io, 'PNG', optimize=False)
-    img_io.seek(0)
-    
-    return send_file(img_io, mimetype='image/png')
+    return img_io.getvalue()
+
+
+# Decodificar + reescalar + recodificar el BMP en cada petición era
+# trabajo repetido sobre una imagen que nunca cambia en el proceso
+_MAP_HIRES_PNG = _build_map_hires_png()
+
+
+@app.route('/api/map-hires')
+def get_map_hires():
+    """Serve high-resolution map for Plotly (4x scale)"""
+    # Mismo trato que /api/map: el PNG no cambia, que el navegador lo
+    # guarde y no vuelva a pedir ~200 KB en cada optimización
+    resp = send_file(io.BytesIO(_MAP_HIRES_PNG), mimetype='image/png',
+                     max_age=31536000)
+    resp.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return resp
 
 @app.route('/api/state')
 def get_state():
@@ -105,7 +163,7 @@ def get_state():
         'stage': session['stage'],
         'stage_name': get_current_stage_name(),
         'points': session['points'],
-        'routes': session['routes'],
+        'version': session['version'],
         'map_size': {'width': W, 'height': H}
     })
 
@@ -141,7 +199,8 @@ def select_point():
         session['stage'] = 0
         if session['agent'] < N_AGENTS - 1:
             session['agent'] += 1
-    
+
+    session['version'] += 1
     session.modified = True
     
     return jsonify({
@@ -159,44 +218,34 @@ def optimize():
     """Run NSGA-II optimization"""
     init_session()
     
-    # Validate all points are selected
-    points_ok = all(
-        len(session['points'][str(a)]) == 3 
-        for a in range(N_AGENTS)
-    )
-    
-    if not points_ok:
-        return jsonify({
-            'success': False,
-            'error': '🚫 Faltan puntos para algún agente. Completa todos los puntos primero.'
-        }), 400
-    
-    # Extract points
-    starts = [tuple(session['points'][str(a)]['start']) for a in range(N_AGENTS)]
-    picks = [tuple(session['points'][str(a)]['pickup']) for a in range(N_AGENTS)]
-    drops = [tuple(session['points'][str(a)]['drop']) for a in range(N_AGENTS)]
-    
+    # Una sola pasada sobre los puntos: valida que estén los tres por
+    # agente y construye de paso las tuplas que sirven de clave de caché
+    starts, picks, drops = [], [], []
+    for a in range(N_AGENTS):
+        pts = session['points'][str(a)]
+        s, p, d = pts.get('start'), pts.get('pickup'), pts.get('drop')
+        if s is None or p is None or d is None:
+            return jsonify({
+                'success': False,
+                'error': '🚫 Faltan puntos para algún agente. Completa todos los puntos primero.'
+            }), 400
+        starts.append(tuple(s))
+        picks.append(tuple(p))
+        drops.append(tuple(d))
+
     # Run optimization using existing function
     try:
-        result = run_ga_multi_streamlit(
-            env,
-            starts=starts,
-            picks=picks,
-            drops=drops,
-            pop_size=120,
-            ngen=70,
-            cxpb=0.6,
-            mutpb=0.3,
-            seed=0
-        )
+        result = _cached_ga(tuple(starts), tuple(picks), tuple(drops))
         
         # Store routes in session
         session['routes'] = result['paths']
+        session['version'] += 1
         session.modified = True
         
         return jsonify({
             'success': True,
-            'routes': result['paths']
+            'routes': result['paths'],
+            'cum_distances': cumulative_distances(result['paths'])
         })
     except Exception as e:
         return jsonify({
@@ -207,8 +256,13 @@ def optimize():
 @app.route('/api/reset', methods=['POST'])
 def reset():
     """Reset application state"""
+    # La versión sigue creciendo a través del reset para que el
+    # cliente no confunda el estado limpio con uno ya visto
+    old_version = session.get('version', 0)
     session.clear()
     init_session()
+    session['version'] = old_version + 1
+    session.modified = True
     return jsonify({'success': True})
 
 # =============================================================
@@ -222,7 +276,12 @@ HTML_TEMPLATE = '''
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>🏥 Hospital MAOPP - Planificador de Rutas</title>
-    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
+    <link rel="preconnect" href="https://fonts.googleapis.com">
+    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+    <!-- Webfont sin bloquear el render: se aplica cuando carga -->
+    <link rel="stylesheet"
+          href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap"
+          media="print" onload="this.media='all'">
     <style>
         * {
             margin: 0;
@@ -230,8 +289,6 @@ HTML_TEMPLATE = '''
             box-sizing: border-box;
         }
 
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700;800&display=swap');
-        
         body {
             font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
             background: linear-gradient(135deg, #0f2027 0%, #203a43 50%, #2c5364 100%);
@@ -272,14 +329,16 @@ HTML_TEMPLATE = '''
         }
 
         .card {
-            background: rgba(255, 255, 255, 0.08);
-            backdrop-filter: blur(15px);
+            /* Fondo translúcido sólido: backdrop-filter obligaba a un
+               pase de blur de viewport completo por frame */
+            background: rgba(255, 255, 255, 0.1);
             border-radius: 24px;
             padding: 28px;
             box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3), 0 0 0 1px rgba(255, 255, 255, 0.1);
             border: 1px solid rgba(255, 255, 255, 0.15);
             animation: fadeInUp 0.8s ease;
             transition: transform 0.3s ease, box-shadow 0.3s ease;
+            will-change: transform;
         }
         
         .card:hover {
@@ -301,8 +360,10 @@ HTML_TEMPLATE = '''
             border-radius: 20px;
             overflow: hidden;
             cursor: crosshair;
+            touch-action: none;
             box-shadow: 0 8px 30px rgba(0,0,0,0.4), 0 0 0 1px rgba(255,255,255,0.1);
             transition: box-shadow 0.3s ease;
+            will-change: transform;
         }
         
         .map-container:hover {
@@ -318,7 +379,15 @@ HTML_TEMPLATE = '''
             image-rendering: pixelated;
             image-rendering: crisp-edges;
         }
-        
+
+        /* Capa de overlay (puntos/labels) apilada sobre el mapa
+           estático: solo ella se repinta al cambiar los puntos */
+        #map-overlay {
+            position: absolute;
+            top: 0;
+            left: 0;
+        }
+
         .map-legend {
             position: absolute;
             top: 15px;
@@ -379,7 +448,8 @@ HTML_TEMPLATE = '''
             padding: 20px;
             border-radius: 15px;
             border: 2px solid rgba(255, 255, 255, 0.15);
-            transition: all 0.3s ease;
+            transition: transform 0.3s ease, background 0.3s ease, border-color 0.3s ease;
+            will-change: transform;
         }
         
         .status-card:hover {
@@ -410,7 +480,7 @@ HTML_TEMPLATE = '''
             height: 12px;
             border-radius: 50%;
             background: rgba(255, 255, 255, 0.3);
-            transition: all 0.3s ease;
+            transition: transform 0.3s ease, background 0.3s ease, box-shadow 0.3s ease;
         }
 
         .stage-dot.active {
@@ -426,7 +496,8 @@ HTML_TEMPLATE = '''
             border: none;
             border-radius: 14px;
             cursor: pointer;
-            transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+            transition: transform 0.3s cubic-bezier(0.4, 0, 0.2, 1), box-shadow 0.3s cubic-bezier(0.4, 0, 0.2, 1);
+            will-change: transform;
             box-shadow: 0 4px 15px rgba(0, 0, 0, 0.2);
             text-transform: uppercase;
             letter-spacing: 0.8px;
@@ -647,8 +718,9 @@ HTML_TEMPLATE = '''
             <div class="card">
                 <h2>🗺️ Mapa Hospitalario</h2>
                 <div class="map-container" id="map-container">
-                    <canvas id="map-canvas"></canvas>
-                    
+                    <canvas id="map-bg"></canvas>
+                    <canvas id="map-overlay"></canvas>
+
                     <!-- Legend -->
                     <div class="map-legend">
                         <div class="legend-title">Leyenda</div>
@@ -732,6 +804,11 @@ HTML_TEMPLATE = '''
                 </div>
             </div>
             
+            <div style="display: flex; align-items: center; gap: 15px; margin-bottom: 15px;">
+                <button class="btn btn-primary" id="btn-anim-play">▶ Play</button>
+                <button class="btn btn-primary" id="btn-anim-pause">⏸ Pause</button>
+                <span id="anim-frame-label" style="font-weight: 600;"></span>
+            </div>
             <div id="plotly-animation"></div>
         </div>
     </div>
@@ -742,30 +819,89 @@ HTML_TEMPLATE = '''
         const stageMarkers = { 'start': '●', 'pickup': '■', 'drop': '✕' };
         
         let state = null;
-        let canvas = null;
+        let bgCanvas = null;
+        let bgCtx = null;
+        let canvas = null;   // overlay: puntos, labels y click pendiente
         let ctx = null;
         let mapImage = null;
         let pendingClick = null;
+        let cachedRect = null;
+
+        // Handles del DOM resueltos una vez en init(): evita los
+        // getElementById repetidos en cada poll / frame de animación
+        const dom = {};
 
         // Initialize
         async function init() {
-            canvas = document.getElementById('map-canvas');
+            bgCanvas = document.getElementById('map-bg');
+            bgCtx = bgCanvas.getContext('2d');
+            canvas = document.getElementById('map-overlay');
             ctx = canvas.getContext('2d');
-            
+            buildSprites();
+
+            dom.currentAgent = document.getElementById('current-agent');
+            dom.currentStage = document.getElementById('current-stage');
+            dom.stageDots = document.querySelectorAll('.stage-dot');
+            dom.btnOptimize = document.getElementById('btn-optimize');
+            dom.pointsList = document.getElementById('points-list');
+            dom.animFrameLabel = document.getElementById('anim-frame-label');
+            dom.metricCollisions = document.getElementById('metric-collisions');
+            dom.metricMinDist = document.getElementById('metric-min-dist');
+            dom.metricTotalDist = document.getElementById('metric-total-dist');
+            dom.metricTime = document.getElementById('metric-time');
+
             await loadState();
             await loadMap();
-            
-            canvas.addEventListener('click', handleMapClick);
-            document.getElementById('btn-optimize').addEventListener('click', handleOptimize);
+
+            // Rect del canvas cacheado: leerlo en cada click fuerza un
+            // layout síncrono; se invalida solo cuando cambia el tamaño
+            cachedRect = canvas.getBoundingClientRect();
+            window.addEventListener('resize', () => {
+                cachedRect = canvas.getBoundingClientRect();
+            }, { passive: true });
+            new ResizeObserver(() => {
+                cachedRect = canvas.getBoundingClientRect();
+            }).observe(canvas);
+            // El rect es relativo al viewport: el scroll lo invalida
+            // (se recalcula perezosamente en el siguiente click)
+            window.addEventListener('scroll', () => {
+                cachedRect = null;
+            }, { passive: true });
+
+            // pointerdown evita los ~300 ms de heurística táctil del
+            // click; passive deja el dispatch fuera del camino de scroll.
+            // Los botones siguen en click por accesibilidad.
+            canvas.addEventListener('pointerdown', handleMapClick, { passive: true });
+            dom.btnOptimize.addEventListener('click', handleOptimize);
             document.getElementById('btn-reset').addEventListener('click', handleReset);
-            
-            // Auto-refresh state every second
-            setInterval(loadState, 1000);
+
+            // Auto-refresh solo con la pestaña visible
+            startPolling();
+            document.addEventListener('visibilitychange', () => {
+                if (document.hidden) stopPolling();
+                else { loadState(); startPolling(); }
+            });
+        }
+
+        let pollId = null;
+        let lastVersion = -1;
+
+        function startPolling() {
+            if (pollId === null) pollId = setInterval(loadState, 1000);
+        }
+
+        function stopPolling() {
+            clearInterval(pollId);
+            pollId = null;
         }
 
         async function loadState() {
             const response = await fetch('/api/state');
             state = await response.json();
+            // El servidor versiona el estado: si no ha cambiado desde el
+            // último poll, no hay nada que repintar
+            if (state.version === lastVersion) return;
+            lastVersion = state.version;
             updateUI();
         }
 
@@ -773,28 +909,34 @@ HTML_TEMPLATE = '''
             return new Promise((resolve) => {
                 mapImage = new Image();
                 mapImage.onload = () => {
-                    // Scale up for better quality
+                    // El mapa base se queda a resolución nativa: el
+                    // reescalado nítido lo hace CSS (image-rendering:
+                    // pixelated), con 16x menos píxeles en el backing
+                    // store. Se pinta UNA vez; los repintados
+                    // posteriores solo tocan el overlay.
+                    bgCanvas.width = mapImage.width;
+                    bgCanvas.height = mapImage.height;
+                    bgCtx.drawImage(mapImage, 0, 0);
+
+                    // El overlay mantiene el backing 4x para que los
+                    // sprites y labels sigan siendo legibles
                     const scale = 4;
                     canvas.width = mapImage.width * scale;
                     canvas.height = mapImage.height * scale;
-                    drawMap();
+
+                    drawOverlay();
                     resolve();
                 };
-                mapImage.src = '/api/map?t=' + Date.now();
+                mapImage.src = '/api/map';
             });
         }
 
-        function drawMap() {
+        function drawOverlay() {
             if (!mapImage || !ctx) return;
-            
+
             const scale = 4;
             ctx.clearRect(0, 0, canvas.width, canvas.height);
-            
-            // Disable smoothing for crisp pixels
-            ctx.imageSmoothingEnabled = false;
-            ctx.drawImage(mapImage, 0, 0, canvas.width, canvas.height);
-            ctx.imageSmoothingEnabled = true;
-            
+
             // Draw all selected points
             if (state && state.points) {
                 for (let a = 0; a < 4; a++) {
@@ -818,45 +960,83 @@ HTML_TEMPLATE = '''
             }
         }
 
-        function drawPoint(x, y, color, stageName, agentNum) {
-            const markers = { 'start': '●', 'pickup': '■', 'drop': '✕' };
+        // =====================================================
+        // Sprites de marcador pre-rasterizados por (agente, etapa).
+        // El marcador y su label ("1-S", "1-P", ...) nunca cambian,
+        // así que se dibujan UNA vez en un OffscreenCanvas y cada
+        // repintado del overlay es un único drawImage por punto en
+        // vez de ~media docena de operaciones de path + texto.
+        // =====================================================
+        const SPRITE_W = 64, SPRITE_H = 32;
+        const SPRITE_AX = 16, SPRITE_AY = 16;  // ancla del marcador
+        const sprites = {};
+
+        function buildSprites() {
             const sizes = { 'start': 4, 'pickup': 5, 'drop': 6 };
-            
-            ctx.fillStyle = color;
-            ctx.strokeStyle = '#ffffff';
-            ctx.lineWidth = 1.5;
-            
-            // Draw marker
-            ctx.beginPath();
-            ctx.arc(x, y, sizes[stageName], 0, 2 * Math.PI);
-            ctx.fill();
-            ctx.stroke();
-            
-            // Draw label
-            ctx.font = 'bold 10px Inter';
-            ctx.fillStyle = '#ffffff';
-            ctx.strokeStyle = '#000000';
-            ctx.lineWidth = 2.5;
-            const label = `${agentNum + 1}-${stageName[0].toUpperCase()}`;
-            ctx.strokeText(label, x + 10, y + 4);
-            ctx.fillText(label, x + 10, y + 4);
+            for (let a = 0; a < 4; a++) {
+                for (const stage of stageNames) {
+                    const oc = new OffscreenCanvas(SPRITE_W, SPRITE_H);
+                    const octx = oc.getContext('2d');
+
+                    octx.fillStyle = colors[a];
+                    octx.strokeStyle = '#ffffff';
+                    octx.lineWidth = 1.5;
+                    octx.beginPath();
+                    octx.arc(SPRITE_AX, SPRITE_AY, sizes[stage], 0, 2 * Math.PI);
+                    octx.fill();
+                    octx.stroke();
+
+                    // Stack de sistema: los sprites se rasterizan en el
+                    // init, antes de que llegue la webfont, y así no
+                    // dependen de cuándo resuelva Inter
+                    octx.font = 'bold 10px system-ui, -apple-system, sans-serif';
+                    octx.fillStyle = '#ffffff';
+                    octx.strokeStyle = '#000000';
+                    octx.lineWidth = 2.5;
+                    const label = `${a + 1}-${stage[0].toUpperCase()}`;
+                    octx.strokeText(label, SPRITE_AX + 10, SPRITE_AY + 4);
+                    octx.fillText(label, SPRITE_AX + 10, SPRITE_AY + 4);
+
+                    sprites[`${a}-${stage}`] = oc;
+                }
+            }
         }
 
+        function drawPoint(x, y, color, stageName, agentNum) {
+            ctx.drawImage(sprites[`${agentNum}-${stageName}`],
+                          x - SPRITE_AX, y - SPRITE_AY);
+        }
+
+        let clickCtrl = null;
+        let lastClickTs = 0;
+
         function handleMapClick(e) {
-            const rect = canvas.getBoundingClientRect();
+            // Coalescer ráfagas/doble-click: el último click gana
+            const now = performance.now();
+            if (now - lastClickTs < 50) return;
+            lastClickTs = now;
+
+            if (!cachedRect) cachedRect = canvas.getBoundingClientRect();
+            const rect = cachedRect;
             const scaleX = canvas.width / rect.width;
             const scaleY = canvas.height / rect.height;
             const scale = 4;
             const x = Math.floor((e.clientX - rect.left) * scaleX / scale);
             const y = Math.floor((e.clientY - rect.top) * scaleY / scale);
-            
+
             pendingClick = { x, y };
-            drawMap();
-            
+            drawOverlay();
+
+            // Single-flight: un click nuevo aborta la petición anterior
+            // para que solo la respuesta más reciente toque la UI
+            if (clickCtrl) clickCtrl.abort();
+            clickCtrl = new AbortController();
+
             fetch('/api/select-point', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ x, y })
+                body: JSON.stringify({ x, y }),
+                signal: clickCtrl.signal
             })
             .then(async response => {
                 const data = await response.json();
@@ -865,73 +1045,122 @@ HTML_TEMPLATE = '''
                 } else {
                     showAlert(`✓ Punto confirmado para Agente ${data.agent + 1} - ${data.stage.toUpperCase()}`, 'success');
                     await loadState();
-                    drawMap();
                 }
                 pendingClick = null;
+                drawOverlay();
             })
             .catch(error => {
+                if (error.name === 'AbortError') return;  // superado por un click posterior
                 showAlert('Error al seleccionar punto', 'error');
                 pendingClick = null;
+                drawOverlay();
             });
         }
 
         function updateUI() {
             if (!state) return;
-            
-            // Update status
-            document.getElementById('current-agent').textContent = `${state.agent + 1} / 4`;
-            document.getElementById('current-stage').textContent = state.stage_name.toUpperCase();
-            
-            // Update stage indicators
-            document.querySelectorAll('.stage-dot').forEach((dot, idx) => {
-                dot.classList.toggle('active', idx === state.stage);
+
+            // Escrituras de estado agrupadas en un rAF para alinearlas
+            // con el ciclo de pintado del navegador
+            requestAnimationFrame(() => {
+                const agentText = `${state.agent + 1} / 4`;
+                if (agentText !== lastAgentText) {
+                    lastAgentText = agentText;
+                    dom.currentAgent.textContent = agentText;
+                }
+                const stageText = state.stage_name.toUpperCase();
+                if (stageText !== lastStageText) {
+                    lastStageText = stageText;
+                    dom.currentStage.textContent = stageText;
+                }
+                dom.stageDots.forEach((dot, idx) => {
+                    dot.classList.toggle('active', idx === state.stage);
+                });
             });
-            
-            // Update points list
-            const pointsList = document.getElementById('points-list');
-            pointsList.innerHTML = '';
-            
+
+            // Enable optimize button if all points selected; solo se
+            // escribe el atributo cuando el valor realmente cambia
+            const allPointsSelected = Object.values(state.points).every(
+                agentPoints => Object.keys(agentPoints).length === 3
+            );
+            if (allPointsSelected !== lastAllSelected) {
+                lastAllSelected = allPointsSelected;
+                dom.btnOptimize.disabled = !allPointsSelected;
+            }
+
+            // Lista de puntos y overlay: solo si los puntos cambiaron
+            // de verdad desde el último render
+            const pointsKey = JSON.stringify(state.points);
+            if (pointsKey === lastPointsKey) return;
+            lastPointsKey = pointsKey;
+
+            // Un DocumentFragment construido con textContent y un único
+            // replaceChildren: un reflow en total, sin parsear HTML
+            const frag = document.createDocumentFragment();
             for (let a = 0; a < 4; a++) {
-                const agentPoints = state.points[a.toString()];
-                const numPoints = Object.keys(agentPoints || {}).length;
-                
+                const agentPoints = state.points[a.toString()] || {};
+                const numPoints = Object.keys(agentPoints).length;
+
                 const agentDiv = document.createElement('div');
                 agentDiv.className = 'agent-points';
                 agentDiv.style.borderLeftColor = colors[a];
-                
-                let html = `<div style="font-weight: 700; margin-bottom: 10px;">Agente ${a + 1} (${numPoints}/3)</div>`;
-                
-                if (agentPoints) {
-                    Object.entries(agentPoints).forEach(([stage, point]) => {
-                        const [y, x] = point;
-                        html += `
-                            <div class="point-item">
-                                <span>${stageMarkers[stage]} ${stage.toUpperCase()}</span>
-                                <span style="font-family: monospace;">(${y}, ${x})</span>
-                            </div>
-                        `;
-                    });
-                }
-                
-                agentDiv.innerHTML = html;
-                pointsList.appendChild(agentDiv);
+
+                const title = document.createElement('div');
+                title.style.fontWeight = '700';
+                title.style.marginBottom = '10px';
+                title.textContent = `Agente ${a + 1} (${numPoints}/3)`;
+                agentDiv.appendChild(title);
+
+                Object.entries(agentPoints).forEach(([stage, point]) => {
+                    const [y, x] = point;
+                    const item = document.createElement('div');
+                    item.className = 'point-item';
+
+                    const name = document.createElement('span');
+                    name.textContent = `${stageMarkers[stage]} ${stage.toUpperCase()}`;
+
+                    const coords = document.createElement('span');
+                    coords.style.fontFamily = 'monospace';
+                    coords.textContent = `(${y}, ${x})`;
+
+                    item.append(name, coords);
+                    agentDiv.appendChild(item);
+                });
+
+                frag.appendChild(agentDiv);
             }
-            
-            // Enable optimize button if all points selected
-            const allPointsSelected = Object.values(state.points).every(
-                agentPoints => Object.keys(agentPoints).length === 3
-            );
-            document.getElementById('btn-optimize').disabled = !allPointsSelected;
-            
-            drawMap();
+            dom.pointsList.replaceChildren(frag);
+
+            drawOverlay();
+        }
+
+        let lastPointsKey = '';
+        let lastAgentText = '';
+        let lastStageText = '';
+        let lastAllSelected = null;
+
+        // Plotly (~1 MB incluso en el bundle gl2d) no se necesita hasta
+        // la primera optimización: cargarlo bajo demanda saca su
+        // parse/compile del camino crítico de arranque de la página
+        function loadPlotly() {
+            if (window.Plotly) return Promise.resolve();
+            return new Promise((resolve, reject) => {
+                const s = document.createElement('script');
+                s.src = 'https://cdn.plot.ly/plotly-gl2d-2.27.0.min.js';
+                s.onload = resolve;
+                s.onerror = reject;
+                document.head.appendChild(s);
+            });
         }
 
         async function handleOptimize() {
-            const btn = document.getElementById('btn-optimize');
+            const btn = dom.btnOptimize;
             btn.disabled = true;
             btn.innerHTML = '<div class="loader"></div> Optimizando...';
-            
+
             try {
+                // La descarga de Plotly se solapa con la optimización
+                const plotlyReady = loadPlotly();
                 const response = await fetch('/api/optimize', { method: 'POST' });
                 const data = await response.json();
                 
@@ -940,7 +1169,8 @@ HTML_TEMPLATE = '''
                 } else {
                     showAlert('✓ Optimización completada!', 'success');
                     await loadState();
-                    displayRoutes(data.routes);
+                    await plotlyReady;
+                    displayRoutes(data.routes, data.cum_distances);
                 }
             } catch (error) {
                 showAlert('Error durante la optimización', 'error');
@@ -972,13 +1202,92 @@ HTML_TEMPLATE = '''
             }, 3000);
         }
 
-        function displayRoutes(routes) {
+        // =====================================================
+        // LTTB (Largest-Triangle-Three-Buckets) sobre los puntos
+        // (y, x) de una ruta: reduce la densidad de dibujo a un
+        // presupuesto fijo conservando la forma visual del camino
+        // =====================================================
+        function lttb(points, threshold) {
+            const n = points.length;
+            if (threshold >= n || threshold < 3) return points;
+
+            const every = (n - 2) / (threshold - 2);
+            const sampled = [points[0]];
+            let aIdx = 0;
+
+            for (let i = 0; i < threshold - 2; i++) {
+                // Media del bucket siguiente
+                const avgStart = Math.floor((i + 1) * every) + 1;
+                const avgEnd = Math.min(Math.floor((i + 2) * every) + 1, n);
+                let avgY = 0, avgX = 0;
+                for (let j = avgStart; j < avgEnd; j++) {
+                    avgY += points[j][0];
+                    avgX += points[j][1];
+                }
+                avgY /= (avgEnd - avgStart);
+                avgX /= (avgEnd - avgStart);
+
+                // Punto del bucket actual con mayor área de triángulo
+                const rangeStart = Math.floor(i * every) + 1;
+                const rangeEnd = Math.floor((i + 1) * every) + 1;
+                const aY = points[aIdx][0], aX = points[aIdx][1];
+
+                let maxArea = -1, maxIdx = rangeStart;
+                for (let j = rangeStart; j < rangeEnd; j++) {
+                    const area = Math.abs(
+                        (aX - avgX) * (points[j][0] - aY) -
+                        (aX - points[j][1]) * (avgY - aY)
+                    );
+                    if (area > maxArea) {
+                        maxArea = area;
+                        maxIdx = j;
+                    }
+                }
+
+                sampled.push(points[maxIdx]);
+                aIdx = maxIdx;
+            }
+
+            sampled.push(points[n - 1]);
+            return sampled;
+        }
+
+        const LTTB_BUDGET = 300;  // puntos visuales por agente
+
+        function displayRoutes(routes, cumDistances) {
             const container = document.getElementById('animation-container');
             container.style.display = 'block';
             container.scrollIntoView({ behavior: 'smooth' });
-            
+
             const maxLen = Math.max(...routes.map(r => r.length));
-            
+
+            // Distancia acumulada por agente: la sirve el servidor
+            // (np.cumsum sobre np.hypot); el bucle local queda solo
+            // como fallback
+            const prefix = (cumDistances && cumDistances.length === routes.length)
+                ? cumDistances
+                : routes.map(route => {
+                    const p = new Float64Array(route.length);
+                    for (let i = 1; i < route.length; i++) {
+                        const dy = route[i][0] - route[i-1][0];
+                        const dx = route[i][1] - route[i-1][1];
+                        p[i] = p[i-1] + Math.hypot(dy, dx);
+                    }
+                    return p;
+                });
+
+            // Acumulado TOTAL por frame en un array contiguo: el padding
+            // (última distancia repetida) se resuelve una vez por agente,
+            // no con Math.min por agente y por frame dentro del bucle t
+            const totalPrefix = new Float64Array(maxLen);
+            for (let a = 0; a < routes.length; a++) {
+                const p = prefix[a];
+                const last = p[p.length - 1];
+                for (let t = 0; t < maxLen; t++) {
+                    totalPrefix[t] += t < p.length ? p[t] : last;
+                }
+            }
+
             // Calculate metrics for all frames
             const metrics = [];
             for (let t = 0; t < maxLen; t++) {
@@ -986,103 +1295,86 @@ HTML_TEMPLATE = '''
                     const idx = Math.min(t, route.length - 1);
                     return route[idx];
                 });
-                
-                // Calculate collisions (distance < 6 pixels)
+
+                // Calculate collisions (distance < 6 pixels).
+                // Comparación en distancia al cuadrado: el sqrt solo
+                // se paga una vez al final, para el valor mostrado
                 let collisions = 0;
-                let minDist = Infinity;
+                let minDist2 = Infinity;
                 for (let i = 0; i < positions.length; i++) {
                     for (let j = i + 1; j < positions.length; j++) {
                         const dy = positions[i][0] - positions[j][0];
                         const dx = positions[i][1] - positions[j][1];
-                        const dist = Math.sqrt(dx * dx + dy * dy);
-                        minDist = Math.min(minDist, dist);
-                        if (dist < 6) collisions++;
+                        const d2 = dx * dx + dy * dy;
+                        if (d2 < minDist2) minDist2 = d2;
+                        if (d2 < 36) collisions++;
                     }
                 }
-                
-                // Calculate total distance
-                let totalDist = 0;
-                routes.forEach(route => {
-                    const idx = Math.min(t, route.length - 1);
-                    for (let i = 1; i <= idx; i++) {
-                        const dy = route[i][0] - route[i-1][0];
-                        const dx = route[i][1] - route[i-1][1];
-                        totalDist += Math.sqrt(dx * dx + dy * dy);
-                    }
-                });
-                
+
                 metrics.push({
                     collisions,
-                    minDist: minDist === Infinity ? 0 : minDist,
-                    totalDist,
+                    minDist: minDist2 === Infinity ? 0 : Math.sqrt(minDist2),
+                    totalDist: totalPrefix[t],
                     time: t
                 });
             }
             
             // Update initial metrics
             updateMetrics(metrics[0]);
-            
+
+            // Presupuesto visual fijo por agente: las rutas largas se
+            // adelgazan con LTTB SOLO para el dibujo; las métricas de
+            // arriba siguen usando las rutas completas
+            const visRoutes = routes.map(
+                r => r.length > LTTB_BUDGET ? lttb(r, LTTB_BUDGET) : r
+            );
+            const visMaxLen = Math.max(...visRoutes.map(r => r.length));
+
             // Prepare traces for each agent (scaled 4x to match map)
             const scale = 4;
-            const traces = routes.map((route, i) => ({
+            // scattergl: el render pasa a WebGL (GPU) en lugar de SVG,
+            // imprescindible con cientos de frames x 4 agentes
+            const traces = visRoutes.map((route, i) => ({
                 x: [route[0][1] * scale],
                 y: [(state.map_size.height - route[0][0]) * scale],
+                type: 'scattergl',
                 mode: 'lines+markers',
                 line: { color: colors[i], width: 3 },
                 marker: { size: 6 },
                 name: `Agente ${i + 1}`
             }));
             
-            // Add start/pickup/drop markers (scaled 4x)
+            // Add start/pickup/drop markers (scaled 4x). Una sola traza
+            // scattergl por agente con arrays de símbolo/texto por punto:
+            // 4 draw calls en vez de 12 trazas de un punto cada una
+            const stageSymbols = { start: 'circle', pickup: 'square', drop: 'x' };
             routes.forEach((route, a) => {
                 const agentPoints = state.points[a.toString()];
+                const xs = [], ys = [], syms = [], texts = [];
                 Object.entries(agentPoints).forEach(([stage, point]) => {
                     const [y, x] = point;
-                    traces.push({
-                        x: [x * scale],
-                        y: [(state.map_size.height - y) * scale],
-                        mode: 'markers+text',
-                        marker: {
-                            size: 12,
-                            color: colors[a],
-                            symbol: stage === 'start' ? 'circle' : (stage === 'pickup' ? 'square' : 'x'),
-                            line: { width: 2, color: '#fff' }
-                        },
-                        text: [`${a + 1}-${stage[0].toUpperCase()}`],
-                        textposition: 'top center',
-                        textfont: { size: 10, color: '#fff', family: 'Inter, sans-serif' },
-                        showlegend: false
-                    });
+                    xs.push(x * scale);
+                    ys.push((state.map_size.height - y) * scale);
+                    syms.push(stageSymbols[stage]);
+                    texts.push(`${a + 1}-${stage[0].toUpperCase()}`);
                 });
-            });
-            
-            // Create frames (scaled 4x)
-            const frames = [];
-            for (let t = 0; t < maxLen; t++) {
-                const frameData = routes.map((route, i) => {
-                    const points = route.slice(0, t + 1);
-                    return {
-                        x: points.map(p => p[1] * scale),
-                        y: points.map(p => (state.map_size.height - p[0]) * scale)
-                    };
-                });
-                frames.push({ 
-                    data: frameData, 
-                    name: t.toString(),
-                    layout: {
-                        title: { 
-                            text: `Evolución de Rutas con NSGA-II - Frame ${t}/${maxLen}`,
-                            font: { 
-                                size: 22,
-                                color: '#4facfe',
-                                family: 'Inter, sans-serif',
-                                weight: 700
-                            }
-                        }
-                    }
+                traces.push({
+                    x: xs,
+                    y: ys,
+                    type: 'scattergl',
+                    mode: 'markers+text',
+                    marker: {
+                        size: 12,
+                        color: colors[a],
+                        symbol: syms,
+                        line: { width: 2, color: '#fff' }
+                    },
+                    text: texts,
+                    textposition: 'top center',
+                    textfont: { size: 10, color: '#fff', family: 'Inter, sans-serif' },
+                    showlegend: false
                 });
-            }
-            
+            });
             
             const layout = {
                 width: 1100,
@@ -1134,87 +1426,102 @@ HTML_TEMPLATE = '''
                     xanchor: 'center',
                     yanchor: 'top',
                     pad: { t: 10, b: 10 }
-                },
-                updatemenus: [{
-                    type: 'buttons',
-                    showactive: true,
-                    y: 1.08,  // Ajustado para que no se superponga con el título
-                    x: 0.12,  // Movido más a la izquierda
-                    xanchor: 'left',
-                    buttons: [
-                        {
-                            label: '▶ Play',
-                            method: 'animate',
-                            args: [null, {
-                                frame: { duration: 100, redraw: true },
-                                fromcurrent: true,
-                                transition: { duration: 0 },
-                                mode: 'immediate'
-                            }]
-                        },
-                        {
-                            label: '⏸ Pause',
-                            method: 'animate',
-                            args: [[null], { 
-                                frame: { duration: 0 }, 
-                                mode: 'immediate',
-                                transition: { duration: 0 }
-                            }]
-                        }
-                    ]
-                }],
-                sliders: [{
-                    active: 0,
-                    steps: frames.map((frame, idx) => ({
-                        args: [[frame.name], {
-                            frame: { duration: 0, redraw: true },
-                            mode: 'immediate',
-                            transition: { duration: 0 }
-                        }],
-                        label: idx.toString(),
-                        method: 'animate'
-                    })),
-                    x: 0.1,
-                    len: 0.8,
-                    y: 0,
-                    yanchor: 'top'
-                }]
+                }
             };
-            
+
             Plotly.newPlot('plotly-animation', traces, layout).then(() => {
-                Plotly.addFrames('plotly-animation', frames);
-                
-                // Listen to animation frames to update metrics
-                const plotDiv = document.getElementById('plotly-animation');
-                plotDiv.on('plotly_animating', () => {
-                    // Get current frame from slider
-                    const sliderValue = plotDiv.layout.sliders ? plotDiv.layout.sliders[0].active : 0;
-                    if (metrics[sliderValue]) {
-                        updateMetrics(metrics[sliderValue]);
-                    }
-                });
-                
-                // Also listen to slider changes
-                plotDiv.on('plotly_sliderchange', (data) => {
-                    const frameIdx = parseInt(data.step.label);
-                    if (metrics[frameIdx]) {
-                        updateMetrics(metrics[frameIdx]);
-                    }
-                });
+                anim.routes = visRoutes;
+                anim.metrics = metrics;
+                anim.maxLen = visMaxLen;
+                // Las métricas van indexadas por timestep original:
+                // mapear frame visual -> timestep
+                anim.metricStep = (maxLen - 1) / Math.max(visMaxLen - 1, 1);
+                anim.frame = 1;  // el punto 0 ya está en las trazas base
+                anim.playing = false;
+
+                dom.animFrameLabel.textContent = `Frame 0 / ${visMaxLen - 1}`;
+                document.getElementById('btn-anim-play').onclick = startAnimation;
+                document.getElementById('btn-anim-pause').onclick = pauseAnimation;
             });
         }
+
+        // =====================================================
+        // Driver de animación: en vez de pre-construir maxLen
+        // frames completos (O(maxLen²) en memoria y datos que
+        // Plotly tiene que re-diffear), cada tick añade SOLO el
+        // siguiente punto de cada agente con extendTraces dentro
+        // de un bucle requestAnimationFrame. El contador de frame
+        // es un textContent barato, no un title del layout (que
+        // forzaría un relayout completo por frame).
+        // =====================================================
+        const anim = { routes: null, metrics: null, maxLen: 0,
+                       metricStep: 1, frame: 1, playing: false };
+
+        function animTick() {
+            if (!anim.playing || !anim.routes) return;
+            const t = anim.frame;
+            if (t >= anim.maxLen) {
+                anim.playing = false;
+                return;
+            }
+
+            const scale = 4;
+            const upd = {
+                x: anim.routes.map(r => {
+                    const p = r[Math.min(t, r.length - 1)];
+                    return [p[1] * scale];
+                }),
+                y: anim.routes.map(r => {
+                    const p = r[Math.min(t, r.length - 1)];
+                    return [(state.map_size.height - p[0]) * scale];
+                })
+            };
+            Plotly.extendTraces('plotly-animation', upd,
+                                anim.routes.map((r, i) => i));
+
+            dom.animFrameLabel.textContent =
+                `Frame ${t} / ${anim.maxLen - 1}`;
+            const mIdx = Math.round(t * anim.metricStep);
+            if (anim.metrics[mIdx]) {
+                updateMetrics(anim.metrics[mIdx]);
+            }
+
+            anim.frame++;
+            requestAnimationFrame(animTick);
+        }
+
+        function startAnimation() {
+            if (!anim.routes || anim.playing) return;
+
+            if (anim.frame >= anim.maxLen) {
+                // Replay: reiniciar las trazas de agentes a su primer punto
+                const scale = 4;
+                Plotly.restyle('plotly-animation', {
+                    x: anim.routes.map(r => [r[0][1] * scale]),
+                    y: anim.routes.map(r => [(state.map_size.height - r[0][0]) * scale])
+                }, anim.routes.map((r, i) => i));
+                anim.frame = 1;
+            }
+
+            anim.playing = true;
+            requestAnimationFrame(animTick);
+        }
+
+        function pauseAnimation() {
+            anim.playing = false;
+        }
         
         function updateMetrics(metric) {
-            document.getElementById('metric-collisions').textContent = metric.collisions;
-            document.getElementById('metric-collisions').className = 'metric-value ' + 
+            dom.metricCollisions.textContent = metric.collisions;
+            dom.metricCollisions.className = 'metric-value ' +
                 (metric.collisions > 0 ? 'danger' : '');
-            
-            document.getElementById('metric-min-dist').textContent = metric.minDist.toFixed(2) + ' px';
-            document.getElementById('metric-min-dist').className = 'metric-value ' + 
+
+            dom.metricMinDist.textContent = metric.minDist.toFixed(2) + ' px';
+            dom.metricMinDist.className = 'metric-value ' +
                 (metric.minDist < 6 ? 'danger' : (metric.minDist < 10 ? 'warning' : ''));
-            
-            document.getElementById('metric-total-dist').textContent = metric.totalDist.toFixed(1) + ' px';
-            document.getElementById('metric-time').textContent = metric.time;
+
+            dom.metricTotalDist.textContent = metric.totalDist.toFixed(1) + ' px';
+            dom.metricTime.textContent = metric.time;
         }
 
         // Start the application
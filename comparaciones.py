@@ -0,0 +1,75 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from tabulate import tabulate
+
+from algorithms.ga_runner import run_ga
+from algorithms.sa_runner import run_sa
+from algorithms.mulambda_runner import run_mulambda
+
+# ===========================================
+# MEJORES CONFIGURACIONES + SEEDS (find_seeds)
+# ===========================================
+PARAMS_GA = {
+    "pop_size": 150, "ngen": 800, "cxpb": 0.8, "mutpb": 0.3, "seed": 1
+}
+PARAMS_SA = {
+    "n_iter": 5000, "start_temp": 20, "end_temp": 0.01, "seed": 2
+}
+PARAMS_MULAMBDA = {
+    "mu": 120, "lambda_": 50, "ngen": 800, "cxpb": 0.5, "mutpb": 0.5, "seed": 0
+}
+
+# ===========================================
+# EJECUCIÓN
+# ===========================================
+
+def ejecutar_todos():
+    """Lanza GA, SA y μ+λ con sus mejores configs, en paralelo.
+
+    Los tres runners son independientes y CPU-bound, así que van cada
+    uno en su proceso: el wall time queda acotado por el más lento en
+    vez de por la suma de los tres.
+    """
+    with ProcessPoolExecutor(max_workers=3) as ex:
+        f_ga = ex.submit(run_ga, **PARAMS_GA)
+        f_sa = ex.submit(run_sa, **PARAMS_SA)
+        f_es = ex.submit(run_mulambda, **PARAMS_MULAMBDA)
+
+        results = {
+            "GA": f_ga.result(),
+            "SA": f_sa.result(),
+            "MULAMBDA": f_es.result(),
+        }
+    return results
+
+
+def resumen(results):
+    """Tabla comparativa de los tres algoritmos."""
+    rows = []
+    for algo, out in results.items():
+        # El GA llama 'best_clean' a lo que SA/μ+λ llaman 'best_distance'
+        clean = out.get("best_clean", out.get("best_distance"))
+        rows.append([
+            algo,
+            round(out["best_penalized"], 2),
+            round(clean, 2),
+            round(out["time_sec"], 2),
+        ])
+
+    print(tabulate(
+        rows,
+        headers=["Algoritmo", "Penalizado", "Distancia limpia", "Tiempo (s)"],
+        tablefmt="github"
+    ))
+
+# ===========================================
+# MAIN
+# ===========================================
+if __name__ == "__main__":
+    t0 = time.time()
+    results = ejecutar_todos()
+    t1 = time.time()
+
+    resumen(results)
+    print(f"\nTiempo total (paralelo): {t1 - t0:.2f} s")
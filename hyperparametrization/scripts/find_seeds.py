@@ -0,0 +1,100 @@
+import sqlite3
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# ===========================================
+# RUTAS A LAS BASES DE DATOS DE RESULTADOS
+# ===========================================
+RESULTS_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "results"
+)
+
+DB_GA       = os.path.join(RESULTS_DIR, "grid_results_ga.db")
+DB_MULAMBDA = os.path.join(RESULTS_DIR, "grid_results_mulambda.db")
+DB_SA       = os.path.join(RESULTS_DIR, "grid_results_sa.db")
+DB_NSGA2    = os.path.join(RESULTS_DIR, "nsga2_grid.db")
+
+# ===========================================
+# MEJORES CONFIGURACIONES (según los grids)
+# ===========================================
+BEST_CONFIGS = {
+    "ga":       {"pop_size": 150, "ngen": 800, "cxpb": 0.8, "mutpb": 0.3},
+    "mulambda": {"mu": 120, "lambda_": 50, "ngen": 800, "cxpb": 0.5, "mutpb": 0.5},
+    "sa":       {"n_iter": 5000, "start_temp": 20, "end_temp": 0.01},
+}
+
+BEST_CONFIG_NSGA2 = {"pop_size": 120, "ngen": 1000, "cxpb": 0.6, "mutpb": 0.2}
+
+# ===========================================
+# CONSULTAS
+# ===========================================
+
+def open_ro(db_path):
+    """Conexión de solo lectura vía URI: no toma locks de escritura."""
+    return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+
+
+def best_seed_json(db_path, algo, params):
+    """Mejor (seed, score) de una config con params guardados como JSON.
+
+    El filtro va entero en SQL con json_extract y ORDER BY/LIMIT, así que
+    no hay fetchall ni json.loads por fila en Python.
+    """
+    conds = " AND ".join(
+        f"json_extract(params, '$.{k}') = ?" for k in params
+    )
+    sql = (
+        "SELECT seed, score FROM runs "
+        f"WHERE algo = ? AND {conds} "
+        "ORDER BY score ASC LIMIT 1"
+    )
+    con = open_ro(db_path)
+    row = con.execute(sql, (algo, *params.values())).fetchone()
+    con.close()
+    return row
+
+
+def best_seed_nsga2(db_path, params):
+    """Mejor (seed, hv) de la config NSGA-II (columnas planas, HV máximo)."""
+    sql = """
+        SELECT seed, hv FROM runs
+        WHERE pop_size = ? AND ngen = ? AND cxpb = ? AND mutpb = ?
+        ORDER BY hv DESC LIMIT 1
+    """
+    con = open_ro(db_path)
+    row = con.execute(sql, (
+        params["pop_size"], params["ngen"], params["cxpb"], params["mutpb"]
+    )).fetchone()
+    con.close()
+    return row
+
+
+def find_best_seeds():
+    """Devuelve {algo: (seed, score)} para las mejores configs de cada DB.
+
+    Las cuatro DBs son independientes y de solo lectura, así que las
+    consultas van en paralelo en un pool de hilos (I/O-bound: sqlite
+    suelta el GIL mientras lee).
+    """
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futs = {
+            "ga":       ex.submit(best_seed_json, DB_GA, "ga", BEST_CONFIGS["ga"]),
+            "mulambda": ex.submit(best_seed_json, DB_MULAMBDA, "mulambda", BEST_CONFIGS["mulambda"]),
+            "sa":       ex.submit(best_seed_json, DB_SA, "sa", BEST_CONFIGS["sa"]),
+            "nsga2":    ex.submit(best_seed_nsga2, DB_NSGA2, BEST_CONFIG_NSGA2),
+        }
+        return {name: f.result() for name, f in futs.items()}
+
+# ===========================================
+# MAIN
+# ===========================================
+if __name__ == "__main__":
+    best = find_best_seeds()
+
+    for algo in ("ga", "mulambda", "sa"):
+        seed, score = best[algo]
+        print(f"{algo:10s} -> seed={seed}  best_penalized={score:.2f}")
+
+    seed, hv = best["nsga2"]
+    print(f"{'nsga2':10s} -> seed={seed}  hv={hv:.2f}")
@@ -0,0 +1,190 @@
+import os
+import sqlite3
+from functools import lru_cache
+import numpy as np
+import matplotlib
+# Backend Agg antes de importar pyplot: sin event loop de GUI, apto
+# para lotes de run_ids y para correr por SSH sin display
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+
+# ===========================================
+# RUTA A LA BASE DE DATOS NSGA-II
+# ===========================================
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DB_PATH = os.path.join(ROOT_DIR, "hyperparametrization", "results", "nsga2_grid.db")
+
+
+def _connect():
+    con = sqlite3.connect(DB_PATH)
+    # I/O mapeada en memoria: con 256 MB entra la DB entera y las
+    # lecturas calientes son accesos a páginas, no syscalls read()
+    con.execute("PRAGMA mmap_size=268435456")
+    con.execute("PRAGMA cache_size=-65536")
+    con.execute("PRAGMA temp_store=MEMORY")
+    return con
+
+# ===========================================
+# CONSULTAS
+# ===========================================
+
+# Índice cubriente para los frentes: (run_id, f1, f2) convierte la
+# consulta de get_pareto en un range scan del índice sin tocar la tabla.
+# Solo se comprueba una vez por proceso.
+_PARETO_INDEXED = False
+
+
+def _ensure_pareto_index(con):
+    global _PARETO_INDEXED
+    if not _PARETO_INDEXED:
+        con.execute("""
+            CREATE INDEX IF NOT EXISTS idx_pareto_run
+            ON pareto_fronts(run_id, f1, f2)
+        """)
+        con.execute("ANALYZE pareto_fronts")
+        _PARETO_INDEXED = True
+
+
+def get_pareto(run_id):
+    """Frente de Pareto de una run como array (n, 2) float64.
+
+    El buffer se reserva de una vez (COUNT previo) y las filas se
+    copian por lotes con fetchmany: ni lista intermedia de tuplas ni
+    np.array sobre objetos Python, que duplicaba el pico de memoria.
+    """
+    con = _connect()
+    _ensure_pareto_index(con)
+    cur = con.cursor()
+
+    n = cur.execute(
+        "SELECT COUNT(*) FROM pareto_fronts WHERE run_id = ?", (run_id,)
+    ).fetchone()[0]
+
+    buf = np.empty((n, 2), dtype=np.float64)
+    cur.execute(
+        "SELECT f1, f2 FROM pareto_fronts WHERE run_id = ?", (run_id,)
+    )
+    cur.arraysize = 4096
+    i = 0
+    while True:
+        batch = cur.fetchmany()
+        if not batch:
+            break
+        buf[i:i + len(batch)] = batch
+        i += len(batch)
+
+    con.execute("PRAGMA optimize")
+    con.close()
+    # Garantía de contigüidad C: matplotlib se queda con el buffer tal
+    # cual (su np.asarray interno no copia) al dibujar
+    return np.ascontiguousarray(buf)
+
+
+def get_best_run():
+    """Run con mayor hipervolumen de todo el grid."""
+    con = _connect()
+    # Con índice sobre hv el ORDER BY ... LIMIT 1 es un seek al extremo
+    # del índice, no un scan completo con heap de top-1
+    con.execute("CREATE INDEX IF NOT EXISTS idx_runs_hv ON runs(hv DESC)")
+    con.execute("ANALYZE runs")
+    row = con.execute("""
+        SELECT id, pop_size, ngen, cxpb, mutpb, seed, hv, time_sec
+        FROM runs ORDER BY hv DESC LIMIT 1
+    """).fetchone()
+    con.close()
+    return row
+
+
+@lru_cache(maxsize=32)
+def _cached_configs(mtime, limit):
+    con = _connect()
+    # Índice sobre las columnas del GROUP BY: SQLite recorre los grupos
+    # en orden de índice en vez de ordenar toda la tabla primero
+    con.execute("""
+        CREATE INDEX IF NOT EXISTS idx_runs_cfg
+        ON runs(pop_size, ngen, cxpb, mutpb)
+    """)
+    # Tuplas planas (sin row_factory) porque el consumidor desempaqueta
+    # posicionalmente; arraysize=limit deja que sqlite3 dimensione su
+    # buffer de filas de una vez y fetchmany(limit) lo vacía en un paso
+    cur = con.execute("""
+        SELECT pop_size, ngen, cxpb, mutpb,
+               AVG(hv) AS hv_mean, AVG(time_sec) AS time_mean, COUNT(*) AS n
+        FROM runs
+        GROUP BY pop_size, ngen, cxpb, mutpb
+        ORDER BY hv_mean DESC
+        LIMIT ?
+    """, (limit,))
+    cur.arraysize = limit
+    rows = cur.fetchmany(limit)
+    con.close()
+    return rows
+
+
+def get_best_configs(limit=10):
+    """Top-K configuraciones por hipervolumen medio sobre las seeds.
+
+    Memoizada con el mtime de la DB como parte de la clave: mientras el
+    fichero no cambie, las llamadas repetidas son un lookup.
+    """
+    return _cached_configs(os.path.getmtime(DB_PATH), limit)
+
+# ===========================================
+# VISUALIZACIÓN
+# ===========================================
+
+# Figura reutilizada entre llamadas: ax.cla() limpia los artistas sin
+# pagar la construcción de figura/ejes por cada run_id
+_FIG = None
+_AX = None
+
+
+def plot_pareto(run_id, out_path=None):
+    """Scatter del frente de Pareto (penalizado vs distancia limpia).
+
+    Con out_path guarda el PNG directamente (backend Agg, sin GUI);
+    sin él cae en plt.show() para uso interactivo.
+    """
+    global _FIG, _AX
+    pareto = get_pareto(run_id)
+
+    if _FIG is None:
+        _FIG, _AX = plt.subplots(figsize=(8, 6))
+    else:
+        _AX.cla()
+
+    # Vistas 1-D sobre el buffer, sin copias intermedias; un único
+    # scatter dibuja todo el frente de golpe
+    xs, ys = pareto[:, 0], pareto[:, 1]
+    _AX.scatter(xs, ys, s=30, alpha=0.8)
+    _AX.set_xlabel("Fitness penalizado")
+    _AX.set_ylabel("Distancia limpia")
+    _AX.set_title(f"Frente de Pareto — run {run_id}")
+    _AX.grid(alpha=0.3)
+    _FIG.tight_layout()
+
+    if out_path is not None:
+        _FIG.savefig(out_path, dpi=120)
+    else:
+        plt.show()
+
+# ===========================================
+# MAIN
+# ===========================================
+if __name__ == "__main__":
+    best = get_best_run()
+    run_id, pop, ngen, cxpb, mutpb, seed, hv, t = best
+    print(f"Mejor run: id={run_id}  hv={hv:.2f}  seed={seed}")
+    print(f"  pop_size={pop}  ngen={ngen}  cxpb={cxpb}  mutpb={mutpb}  t={t:.1f}s")
+
+    print("\nTop configuraciones por HV medio:")
+    for pop, ngen, cxpb, mutpb, hv_mean, time_mean, n in get_best_configs(5):
+        print(f"  pop={pop:<4} ngen={ngen:<5} cx={cxpb:<4} mut={mutpb:<4}"
+              f"  hv={hv_mean:,.0f}  t={time_mean:.1f}s  ({n} seeds)")
+
+    out_path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "plots", f"pareto_run_{run_id}.png"
+    )
+    plot_pareto(run_id, out_path)
+    print(f"\nFrente de Pareto guardado en {out_path}")
@@ -0,0 +1,272 @@
+import atexit
+import hashlib
+import os
+import pickle
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# ===========================================
+# RUTAS A LAS BASES DE DATOS DE RESULTADOS
+# ===========================================
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT_DIR, "hyperparametrization", "results")
+
+DBS = {
+    "GA":       os.path.join(RESULTS_DIR, "grid_results_ga.db"),
+    "MULAMBDA": os.path.join(RESULTS_DIR, "grid_results_mulambda.db"),
+    "SA":       os.path.join(RESULTS_DIR, "grid_results_sa.db"),
+    "NSGA-II":  os.path.join(RESULTS_DIR, "nsga2_grid.db"),
+}
+
+# Mejores configuraciones de cada grid search
+BEST_CRITERIA = {
+    "GA":       {"pop_size": 150, "ngen": 800, "cxpb": 0.8, "mutpb": 0.3},
+    "MULAMBDA": {"mu": 120, "lambda_": 50, "ngen": 800, "cxpb": 0.5, "mutpb": 0.5},
+    "SA":       {"n_iter": 5000, "start_temp": 20, "end_temp": 0.01},
+    "NSGA-II":  {"pop_size": 120, "ngen": 1000, "cxpb": 0.6, "mutpb": 0.2},
+}
+
+# ===========================================
+# CONSULTAS
+# ===========================================
+
+# SQL ya montado por (algo, claves de criterio): mismas claves → misma
+# cadena, así la caché de prepared statements de sqlite3 reutiliza el
+# programa compilado en vez de parsear/planificar en cada llamada
+_SQL_CACHE = {}
+
+
+def _build_sql(algo_name, crit_keys):
+    key = (algo_name, crit_keys)
+    sql = _SQL_CACHE.get(key)
+    if sql is None:
+        if algo_name == "NSGA-II":
+            conds = " AND ".join(f"{k} = ?" for k in crit_keys)
+            sql = f"SELECT * FROM runs WHERE {conds} ORDER BY hv DESC LIMIT 1"
+        else:
+            # Los params salen ya extraídos como columnas escalares:
+            # el JSON lo parsea SQLite en C y json.loads desaparece
+            cols = ", ".join(
+                f"json_extract(params, '$.{k}') AS {k}" for k in crit_keys
+            )
+            conds = " AND ".join(
+                f"json_extract(params, '$.{k}') = ?" for k in crit_keys
+            )
+            sql = (f"SELECT id, seed, score, time_sec, {cols} "
+                   f"FROM runs WHERE {conds} ORDER BY score ASC LIMIT 1")
+        _SQL_CACHE[key] = sql
+    return sql
+
+
+# Pool de conexiones por db_path: abrir/cerrar en cada consulta tiraba
+# la page cache de SQLite; aquí cada DB se abre una vez y vive hasta el
+# final del proceso
+_CONNS = {}
+
+
+def _get_conn(db_path):
+    con = _CONNS.get(db_path)
+    if con is None:
+        # check_same_thread=False: las conexiones del pool solo hacen
+        # SELECT y el modo serialized de sqlite3 las protege entre hilos
+        con = sqlite3.connect(db_path, cached_statements=128,
+                              check_same_thread=False)
+        con.row_factory = sqlite3.Row
+        # Solo pragmas de lectura: las DBs de resultados se consultan,
+        # no se reescriben, así que nada de tocar el journal_mode
+        con.execute("PRAGMA mmap_size=268435456")
+        con.execute("PRAGMA cache_size=-65536")
+        con.execute("PRAGMA temp_store=MEMORY")
+        _CONNS[db_path] = con
+    return con
+
+
+@atexit.register
+def _close_conns():
+    for con in _CONNS.values():
+        con.close()
+    _CONNS.clear()
+
+
+# Caché en disco por (db, mtime, criterio): las DBs de resultados casi
+# nunca cambian, así que re-ejecutar los informes ni siquiera abre SQLite
+CACHE_DIR = os.path.join(
+    os.path.expanduser("~"), ".cache", "gen_tables"
+)
+
+
+def _disk_cache_path(db_path, param_criteria, algo_name):
+    key = (db_path, os.path.getmtime(db_path),
+           tuple(sorted(param_criteria.items())), algo_name)
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"{digest}.pkl")
+
+
+def get_best_row_details(db_path, param_criteria, algo_name):
+    """Mejor run de una configuración: el filtrado y el top-1 van en SQL.
+
+    Para GA/μ+λ/SA los params están en JSON, así que el WHERE usa
+    json_extract y ORDER BY score ASC LIMIT 1; para NSGA-II las columnas
+    son nativas y el mejor es el de mayor hipervolumen. SQLite devuelve
+    una sola fila: nada de traer la tabla entera y filtrar en Python.
+
+    El resultado se memoiza en disco con el mtime de la DB en la clave:
+    mientras el fichero no cambie, los re-runs leen el pickle.
+    """
+    cache_path = _disk_cache_path(db_path, param_criteria, algo_name)
+    if os.path.exists(cache_path):
+        with open(cache_path, "rb") as f:
+            return pickle.load(f)
+
+    con = _get_conn(db_path)
+
+    # Claves ordenadas: binds posicionales deterministas para que el
+    # mismo criterio genere siempre el mismo SQL cacheado
+    crit_keys = tuple(sorted(param_criteria))
+    sql = _build_sql(algo_name, crit_keys)
+
+    row = con.execute(sql, tuple(param_criteria[k] for k in crit_keys)).fetchone()
+
+    if row is None:
+        return None
+
+    details = dict(row)
+    if algo_name != "NSGA-II":
+        # Reagrupar las columnas extraídas en el orden original del
+        # criterio; ya no queda JSON que decodificar en Python
+        details["params"] = {k: details[k] for k in param_criteria}
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(cache_path, "wb") as f:
+        pickle.dump(details, f)
+    return details
+
+# ===========================================
+# TABLAS
+# ===========================================
+
+def get_all_best_rows():
+    """Las cuatro mejores filas en una sola consulta.
+
+    Las DBs se atachean a una conexión :memory: y un UNION ALL de
+    subconsultas top-1 devuelve todo en un solo fetchall: un pipeline
+    del VDBE y una page cache compartida en vez de cuatro idas y
+    vueltas por ficheros separados.
+    """
+    con = sqlite3.connect(":memory:")
+    parts = []
+    binds = []
+    for algo, db_path in DBS.items():
+        alias = algo.replace("-", "").lower()
+        con.execute(f"ATTACH DATABASE ? AS {alias}", (db_path,))
+        crit = BEST_CRITERIA[algo]
+        if algo == "NSGA-II":
+            conds = " AND ".join(f"{k} = ?" for k in crit)
+            parts.append(
+                f"SELECT * FROM (SELECT '{algo}' AS algo, 'hv' AS metric, "
+                f"hv AS value, seed, time_sec FROM {alias}.runs "
+                f"WHERE {conds} ORDER BY hv DESC LIMIT 1)"
+            )
+        else:
+            conds = " AND ".join(
+                f"json_extract(params, '$.{k}') = ?" for k in crit
+            )
+            parts.append(
+                f"SELECT * FROM (SELECT '{algo}' AS algo, 'score' AS metric, "
+                f"score AS value, seed, time_sec FROM {alias}.runs "
+                f"WHERE {conds} ORDER BY score ASC LIMIT 1)"
+            )
+        binds.extend(crit.values())
+
+    rows = con.execute(" UNION ALL ".join(parts), binds).fetchall()
+    con.close()
+    return rows
+
+
+def collect_data():
+    """Mejor fila de cada algoritmo, en el orden de DBS.
+
+    Las cuatro lecturas son independientes e I/O-bound (sqlite suelta
+    el GIL durante la consulta), así que van en paralelo; además cada
+    una pasa por la caché de disco, que la variante UNION ALL de
+    get_all_best_rows no aprovecha.
+    """
+    jobs = list(DBS.items())
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        rows = list(ex.map(
+            lambda job: get_best_row_details(job[1], BEST_CRITERIA[job[0]], job[0]),
+            jobs
+        ))
+
+    data = []
+    for (algo, _), row in zip(jobs, rows):
+        if row is None:
+            continue
+
+        if algo == "NSGA-II":
+            metric, value = "hv", row["hv"]
+            params = {k: row[k] for k in BEST_CRITERIA[algo]}
+        else:
+            metric, value = "score", row["score"]
+            params = row["params"]
+
+        data.append({
+            "Algo": algo,
+            "Metric": metric,
+            "Value": value,
+            "Seed": row["seed"],
+            "Time": row["time_sec"],
+            "Params": params,
+        })
+    return data
+
+
+# Plantillas compiladas una vez (método .format ya ligado): las
+# filas repetidas no vuelven a parsear los format-specs
+SCORE_TMPL = ("| {Algo:<10} | {Metric:<8} | {Value:<15.2f} "
+              "| {Seed:<4} | {Time:<8.2f} |").format
+PARAMS_TMPL = "| {Algo:<10} | {params:<47} |".format
+
+
+def build_row(item):
+    """Filas ya formateadas para las dos tablas de un item."""
+    score_row = SCORE_TMPL(**item)
+    params_str = ", ".join(f"{k}={v}" for k, v in item["Params"].items())
+    params_row = PARAMS_TMPL(Algo=item["Algo"], params=params_str)
+    return score_row, params_row
+
+
+def print_tables(data):
+    # Una sola pasada sobre data construye las filas de ambas tablas;
+    # todo se acumula en lines y sale por stdout en una única escritura
+    score_rows, params_rows = [], []
+    for item in data:
+        score_row, params_row = build_row(item)
+        score_rows.append(score_row)
+        params_rows.append(params_row)
+
+    sep = "=" * 64
+    lines = [
+        sep,
+        "MEJORES RESULTADOS POR ALGORITMO",
+        sep,
+        f"| {'Algo':<10} | {'Métrica':<8} | {'Valor':<15} | {'Seed':<4} | {'t (s)':<8} |",
+        "|" + "-" * 62 + "|",
+    ]
+    lines.extend(score_rows)
+    lines.extend([
+        "",
+        sep,
+        "PARÁMETROS DE LA MEJOR CONFIGURACIÓN",
+        sep,
+    ])
+    lines.extend(params_rows)
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+# ===========================================
+# MAIN
+# ===========================================
+if __name__ == "__main__":
+    print_tables(collect_data())
@@ -0,0 +1,46 @@
+import os
+import numpy as np
+import pandas as pd
+from scipy.stats import t
+
+# ===========================================
+# RUTA AL CSV COMBINADO
+# ===========================================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CSV_PATH = os.path.join(BASE_DIR, "results", "combined", "all_algorithms_combined.csv")
+
+
+def calculate_stats(csv_path=CSV_PATH):
+    """Resumen estadístico por algoritmo, vectorizado con pandas/NumPy.
+
+    Un groupby + agg sustituye al parseo fila a fila con csv.reader y a
+    statistics.mean/stdev (bucles Python puros): las reducciones corren
+    en C sobre todo el grupo de golpe.
+    """
+    df = pd.read_csv(csv_path, usecols=["algorithm", "best_fitness"])
+    agg = df.groupby("algorithm")["best_fitness"].agg(
+        ["mean", "std", "min", "count"]
+    )
+
+    # Coeficiente de variación y margen del IC 95%: el valor crítico de
+    # la t de Student sale de scipy con los n reales de cada grupo (ppf
+    # acepta el array de grados de libertad entero), no de una constante
+    # fijada a n≈30
+    ns = agg["count"].to_numpy()
+    tcrit = t.ppf(0.975, ns - 1)
+    agg["cv"] = agg["std"] / agg["mean"] * 100
+    agg["margin"] = tcrit * agg["std"] / np.sqrt(ns)
+    agg["ci_lower"] = agg["mean"] - agg["margin"]
+    agg["ci_upper"] = agg["mean"] + agg["margin"]
+    return agg
+
+
+if __name__ == "__main__":
+    stats = calculate_stats()
+
+    print(f"{'Algoritmo':<10} {'Media':>10} {'Std':>9} {'CV%':>6} "
+          f"{'IC 95%':>23} {'Mejor':>10} {'n':>4}")
+    for algo, r in stats.iterrows():
+        print(f"{algo:<10} {r['mean']:>10.2f} {r['std']:>9.2f} {r['cv']:>6.2f} "
+              f"[{r['ci_lower']:>9.2f}, {r['ci_upper']:>9.2f}] "
+              f"{r['min']:>10.2f} {int(r['count']):>4}")